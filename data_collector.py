@@ -1,22 +1,164 @@
 # 필요한 라이브러리 설치
-# !pip install requests beautifulsoup4
+# !pip install requests lxml
 
 import requests
-from bs4 import BeautifulSoup # HTML 태그를 제거하기 위해 사용
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import html
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 import xml.etree.ElementTree as ET
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import json
 
-def fetch_naver_news(company_name: str, display_count: int = 5) -> List[Dict[str, str]]:
+try:
+    from lxml import etree as lxml_etree  # C 구현 스트리밍 파서 (CORPCODE.xml 파싱용)
+except ImportError:
+    lxml_etree = None  # 설치되지 않은 경우 표준 라이브러리 ElementTree 사용
+
+try:
+    import orjson  # 고속 JSON 파서 (API 응답 파싱용)
+except ImportError:
+    orjson = None  # 설치되지 않은 경우 표준 라이브러리 json 사용
+
+try:
+    from tqdm import tqdm  # 배치 리포트 생성 진행률 표시용
+except ImportError:
+    tqdm = None
+
+try:
+    import ahocorasick  # pyahocorasick: 공시 키워드/기업명 다중 패턴 매칭용
+except ImportError:
+    ahocorasick = None  # 설치되지 않은 경우 정규식 기반 매칭 사용
+
+# 네이버 API 응답의 <b>, </b> 등 HTML 태그 제거용 (모듈 로드 시 한 번만 컴파일)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_html(text):
+    """HTML 태그를 제거하고 &quot; 등의 엔티티를 원래 문자로 변환합니다."""
+    return html.unescape(_TAG_RE.sub('', text or ''))
+
+
+@lru_cache(maxsize=64)
+def _format_days_ago(today, days_back):
+    """today 기준 days_back일 전 날짜를 YYYYMMDD 문자열로 변환 (날짜별 캐싱)"""
+    return (today - timedelta(days=days_back)).strftime('%Y%m%d')
+
+
+def date_str_days_ago(days_back=0):
+    """
+    오늘로부터 days_back일 전 날짜를 DART API 형식(YYYYMMDD)으로 반환합니다.
+    날짜별로 캐싱되므로 같은 날 반복 호출해도 문자열을 다시 만들지 않습니다.
+    """
+    return _format_days_ago(date.today(), days_back)
+
+
+def _loads_json(raw):
+    """JSON 바이트/문자열을 파싱합니다. orjson이 있으면 orjson을 사용합니다."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(data):
+    """데이터를 들여쓰기(2칸)된 UTF-8 JSON 바이트로 직렬화합니다. orjson이 있으면 orjson을 사용합니다."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def create_http_session(pool_size=32):
+    """
+    커넥션 풀과 재시도 정책이 설정된 requests.Session을 생성합니다.
+    같은 호스트(네이버/DART)로의 요청은 연결을 재사용하므로 매 호출마다 TCP/TLS 핸드셰이크를 하지 않습니다.
+    
+    Args:
+        pool_size (int): 호스트별 유지할 최대 연결 수 (기본값: 32).
+        
+    Returns:
+        requests.Session: 설정된 세션 객체.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False  # 재시도 후에도 실패하면 raise_for_status()에서 처리
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 모듈 전체에서 공유하는 HTTP 세션
+_SESSION = create_http_session()
+
+# DART API 동시 호출 수 제한 (과도한 병렬 호출로 인한 차단 방지)
+_DART_SEMAPHORE = threading.BoundedSemaphore(8)
+
+# API 응답 디스크 캐시 설정
+API_CACHE_DIR = '.api_cache'
+_DART_CACHE_TTL = 24 * 60 * 60  # 공시 목록은 하루 안에는 거의 변하지 않음
+_NEWS_CACHE_TTL = 10 * 60       # 뉴스는 자주 갱신되므로 짧게 유지
+
+
+def _api_cache_key(url, params):
+    """엔드포인트와 요청 파라미터로 캐시 키(해시)를 생성합니다."""
+    payload = json.dumps([url, sorted(params.items())], ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _api_cache_get(key, ttl):
+    """캐시된 API 응답을 반환합니다. 없거나 TTL이 지났으면 None."""
+    path = os.path.join(API_CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'rb') as f:
+            return _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _api_cache_set(key, data):
+    """API 응답을 캐시에 저장합니다. 저장에 실패해도 호출 흐름에는 영향을 주지 않습니다."""
+    path = os.path.join(API_CACHE_DIR, f"{key}.json")
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(API_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps_json(data))
+        os.replace(tmp_path, path)  # 동시 실행 중에도 깨진 파일이 보이지 않도록 원자적 교체
+    except OSError as e:
+        print(f"⚠️ API 응답 캐시 저장 실패: {e}")
+
+
+def fetch_naver_news(company_name: str, display_count: int = 5, force_refresh: bool = False,
+                     session=None) -> List[Dict[str, str]]:
     """
     네이버 검색 API를 호출하여 특정 회사의 최신 뉴스를 가져옵니다.
+    같은 검색 조건의 응답은 10분간 디스크에 캐싱됩니다.
     
     Args:
         company_name (str): 검색할 회사 이름.
         display_count (int): 가져올 뉴스 기사 수 (기본값: 5).
+        force_refresh (bool): True면 캐시를 무시하고 API를 다시 호출 (기본값: False).
+        session (requests.Session): 사용할 HTTP 세션 (기본값: 모듈 공유 세션).
 
     Returns:
         list[dict]: 뉴스 기사 딕셔너리 리스트 (각 딕셔너리는 'title', 'description' 키를 포함).
@@ -45,25 +187,33 @@ def fetch_naver_news(company_name: str, display_count: int = 5) -> List[Dict[str
         "sort": "date",  # 최신순으로 정렬
     }
     
+    cache_key = _api_cache_key(URL, params)
+    data = None if force_refresh else _api_cache_get(cache_key, _NEWS_CACHE_TTL)
+    
     try:
-        response = requests.get(URL, headers=headers, params=params)
-        # HTTP 오류가 발생하면 예외를 발생시킵니다.
-        response.raise_for_status()
+        if data is None:
+            response = (session or _SESSION).get(URL, headers=headers, params=params)
+            # HTTP 오류가 발생하면 예외를 발생시킵니다.
+            response.raise_for_status()
+            
+            data = _loads_json(response.content)
+            _api_cache_set(cache_key, data)
+        else:
+            print(f"⚡ 캐시된 뉴스 응답 사용: '{company_name}'")
         
-        data = response.json()
         articles = []
         
         print(f"🔍 API 응답 정보: 총 {data.get('total', 0)}건 중 {len(data.get('items', []))}건 반환")
         
         # 3. 제목과 요약을 함께 추출하고, HTML 태그 제거
         for item in data.get('items', []):
-            # BeautifulSoup을 사용해 제목에서 <b>, </b>, &quot; 등 HTML 태그 제거
+            # 제목에서 <b>, </b>, &quot; 등 HTML 태그 제거
             raw_title = item.get('title', '')
-            cleaned_title = BeautifulSoup(raw_title, "html.parser").get_text()
+            cleaned_title = _strip_html(raw_title)
             
             # 요약 내용(description)에서도 HTML 태그 제거
             raw_desc = item.get('description', '')
-            cleaned_desc = BeautifulSoup(raw_desc, "html.parser").get_text()
+            cleaned_desc = _strip_html(raw_desc)
             
             articles.append({"title": cleaned_title, "description": cleaned_desc})
         
@@ -82,6 +232,50 @@ def fetch_naver_news(company_name: str, display_count: int = 5) -> List[Dict[str
         
     return []
 
+def _parse_corp_code_xml(xml_path, show_progress=False):
+    """
+    CORPCODE.xml을 한 번의 순회로 파싱하여 회사명/고유번호 리스트를 반환합니다.
+    lxml이 있으면 iterparse로 'list' 레코드를 하나씩 읽고 바로 메모리에서 해제하므로
+    파일 크기와 무관하게 메모리 사용량이 일정하게 유지됩니다.
+
+    Args:
+        xml_path (str): CORPCODE.xml 파일의 경로.
+        show_progress (bool): True면 10000건마다 진행 상황을 출력합니다.
+
+    Returns:
+        tuple[list, list]: (회사명 리스트, 고유번호 리스트).
+    """
+    if not os.path.exists(xml_path):
+        raise FileNotFoundError(xml_path)
+
+    corp_names = []
+    corp_codes = []
+
+    if lxml_etree is not None:
+        for _, corp in lxml_etree.iterparse(xml_path, events=('end',), tag='list'):
+            corp_names.append(corp.findtext('corp_name'))
+            corp_codes.append(corp.findtext('corp_code'))
+
+            # 처리한 레코드와 앞선 형제 노드를 해제하여 트리가 커지지 않도록 함
+            corp.clear()
+            while corp.getprevious() is not None:
+                del corp.getparent()[0]
+
+            if show_progress and len(corp_names) % 10000 == 0:
+                print(f"  파싱 진행: {len(corp_names):,}건")
+    else:
+        root = ET.parse(xml_path).getroot()
+        # iterfind는 리스트를 만들지 않고 'list' 노드를 하나씩 순회
+        for i, corp in enumerate(root.iterfind('list'), 1):
+            corp_names.append(corp.find('corp_name').text)
+            corp_codes.append(corp.find('corp_code').text)
+
+            if show_progress and i % 10000 == 0:
+                print(f"  파싱 진행: {i:,}건")
+
+    return corp_names, corp_codes
+
+
 def load_corp_codes(xml_path='CORPCODE.xml'):
     """
     CORPCODE.xml 파일을 파싱하여 모든 회사명과 고유번호를
@@ -95,25 +289,11 @@ def load_corp_codes(xml_path='CORPCODE.xml'):
                           파일을 찾지 못하면 None을 반환합니다.
     """
     try:
-        # XML 파일 파싱
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        corp_list = []
-        # XML의 'list' 태그를 모두 찾아서 반복합니다.
-        for corp in root.findall('list'):
-            # 각 태그에서 텍스트 값을 추출합니다.
-            corp_name = corp.find('corp_name').text
-            corp_code = corp.find('corp_code').text
-            
-            # 리스트에 딕셔너리 형태로 추가
-            corp_list.append({
-                'corp_name': corp_name,
-                'corp_code': corp_code
-            })
+        # XML 파일을 스트리밍 방식으로 파싱
+        corp_names, corp_codes = _parse_corp_code_xml(xml_path)
             
         # 리스트를 pandas DataFrame으로 변환
-        df = pd.DataFrame(corp_list)
+        df = pd.DataFrame({'corp_name': corp_names, 'corp_code': corp_codes})
         print(f"✅ 총 {len(df)}개의 상장 기업 정보를 성공적으로 불러왔습니다.")
         return df
 
@@ -125,6 +305,30 @@ def load_corp_codes(xml_path='CORPCODE.xml'):
         return None
 
 
+def _build_code_index(corp_code_df):
+    """
+    회사명 -> 8자리 고유번호 딕셔너리를 생성합니다.
+    같은 회사명이 여러 번 나오면 첫 번째 항목을 사용합니다.
+    """
+    df = corp_code_df.drop_duplicates('corp_name')
+    # 8자리 형식으로 보장 (DART API 요구사항)
+    return dict(zip(df['corp_name'], df['corp_code'].astype(str).str.zfill(8)))
+
+
+# 마지막으로 조회한 DataFrame과 그 인덱스 (DataFrame 참조를 함께 보관하여 id 재사용 문제 방지)
+_code_index_cache = (None, None)
+
+
+def _get_code_index(corp_code_df):
+    """같은 DataFrame으로 반복 조회할 때 인덱스를 다시 만들지 않도록 캐싱합니다."""
+    global _code_index_cache
+    cached_df, index = _code_index_cache
+    if cached_df is not corp_code_df:
+        index = _build_code_index(corp_code_df)
+        _code_index_cache = (corp_code_df, index)
+    return index
+
+
 def find_corp_code(company_name, corp_code_df):
     """
     DataFrame에서 회사명으로 고유번호를 찾습니다.
@@ -139,46 +343,168 @@ def find_corp_code(company_name, corp_code_df):
     if corp_code_df is None:
         return None
         
-    # 'corp_name' 컬럼에서 정확히 일치하는 회사를 찾습니다.
-    result = corp_code_df[corp_code_df['corp_name'] == company_name]
+    # 회사명 인덱스에서 정확히 일치하는 회사를 찾습니다. (최초 1회만 인덱스 생성)
+    corp_code = _get_code_index(corp_code_df).get(company_name)
     
-    if not result.empty:
-        # 찾은 경우, 첫 번째 결과의 'corp_code' 값을 반환합니다.
-        return result.iloc[0]['corp_code']
+    if corp_code:
+        return corp_code
     else:
         print(f"'{company_name}'에 해당하는 회사를 찾을 수 없습니다.")
         return None
 
 
+def get_corp_code_cache_path(csv_path='corp_codes.csv'):
+    """
+    기업 코드 캐시(Parquet) 파일 경로를 반환합니다. (예: corp_codes.csv -> corp_codes.parquet)
+    
+    Args:
+        csv_path (str): 기존 CSV 캐시 경로.
+        
+    Returns:
+        str: Parquet 캐시 파일 경로.
+    """
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+# 기업 코드 캐시 파일 생성/변환을 한 스레드씩만 수행하도록 보호
+_CORP_CODE_CACHE_LOCK = threading.RLock()
+
+
+def _save_corp_code_cache(df, csv_path='corp_codes.csv', clear_memory=True):
+    """
+    기업 코드 DataFrame을 Parquet(zstd 압축) 캐시로 저장합니다.
+    임시 파일에 쓴 뒤 원자적으로 교체하므로 다른 스레드가 쓰는 중인 파일을 읽지 않습니다.
+    
+    Args:
+        df (pandas.DataFrame): 저장할 기업 코드 DataFrame.
+        csv_path (str): 기존 CSV 캐시 경로 (Parquet 경로는 여기서 유도).
+        clear_memory (bool): True면 메모리에 올려둔 조회용 데이터도 초기화 (내용이 바뀐 경우).
+        
+    Returns:
+        str: Parquet 캐시 파일 경로.
+    """
+    cache_path = get_corp_code_cache_path(csv_path)
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    with _CORP_CODE_CACHE_LOCK:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, cache_path)
+        
+        if clear_memory:
+            # 캐시 파일 내용이 바뀌었으므로 메모리에 올려둔 조회용 데이터도 다시 만들도록 초기화
+            _load_corp_code_df.cache_clear()
+            _load_code_map.cache_clear()
+            _load_corp_code_table.cache_clear()
+    return cache_path
+
+
+def _read_corp_code_cache(csv_path='corp_codes.csv'):
+    """
+    기업 코드 캐시를 읽습니다.
+    Parquet 캐시가 있으면 바로 읽고, 기존 CSV만 있으면 CSV를 한 번 읽어 Parquet로 변환합니다.
+    
+    Args:
+        csv_path (str): 기존 CSV 캐시 경로 (Parquet 경로는 여기서 유도).
+        
+    Returns:
+        pandas.DataFrame | None: 캐시 DataFrame 또는 캐시가 없으면 None.
+    """
+    cache_path = get_corp_code_cache_path(csv_path)
+    if os.path.exists(cache_path):
+        # Parquet는 문자열 타입을 그대로 보존하므로 corp_code 앞의 0이 유지됨
+        return pd.read_parquet(cache_path, engine='pyarrow')
+    
+    # 기존 CSV 캐시 -> Parquet 1회 마이그레이션 (여러 스레드가 동시에 변환하지 않도록 잠금)
+    with _CORP_CODE_CACHE_LOCK:
+        # 잠금을 기다리는 동안 다른 스레드가 변환을 마쳤으면 그 결과를 사용
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path, engine='pyarrow')
+        
+        if not os.path.exists(csv_path):
+            return None
+        
+        # corp_code를 문자열로 읽어서 앞의 0이 제거되지 않도록 함
+        df = pd.read_csv(csv_path, dtype={'corp_code': str})
+        try:
+            print(f"💾 CSV 캐시를 Parquet로 변환합니다: {csv_path} -> {cache_path}")
+            # 내용은 같으므로 다른 스레드가 채워 둔 메모리 캐시는 유지
+            _save_corp_code_cache(df, csv_path, clear_memory=False)
+        except Exception as e:
+            print(f"⚠️ Parquet 변환 실패: {e} (CSV로 계속 진행합니다)")
+        return df
+
+
+@lru_cache(maxsize=4)
+def _load_corp_code_df(csv_path='corp_codes.csv'):
+    """
+    기업 코드 캐시 DataFrame을 프로세스당 한 번만 읽어 재사용합니다.
+    캐시 파일이 없으면 FileNotFoundError를 발생시킵니다 (없는 상태는 캐싱하지 않음).
+    """
+    df = _read_corp_code_cache(csv_path)
+    if df is None:
+        raise FileNotFoundError(csv_path)
+    return df
+
+
+@lru_cache(maxsize=4)
+def _load_code_map(csv_path='corp_codes.csv'):
+    """회사명 -> 8자리 고유번호 딕셔너리를 한 번만 만들어 재사용합니다."""
+    return _build_code_index(_load_corp_code_df(csv_path))
+
+
+# 기업 코드 테이블 스키마 (corp_code는 앞의 0이 유지되도록 문자열로 고정)
+CORP_CODE_SCHEMA = pa.schema([('corp_name', pa.string()), ('corp_code', pa.string())])
+
+
+@lru_cache(maxsize=4)
+def _load_corp_code_table(csv_path='corp_codes.csv'):
+    """
+    기업 코드 캐시를 Arrow 테이블로 한 번만 읽어 재사용합니다. (키워드 검색용)
+    Parquet 캐시가 없으면 CSV를 고정 스키마로 읽습니다 (dtype 추론 없음).
+    """
+    cache_path = get_corp_code_cache_path(csv_path)
+    if os.path.exists(cache_path):
+        return pq.read_table(cache_path, columns=CORP_CODE_SCHEMA.names)
+    if os.path.exists(csv_path):
+        return pv.read_csv(
+            csv_path,
+            convert_options=pv.ConvertOptions(
+                column_types=CORP_CODE_SCHEMA,
+                include_columns=CORP_CODE_SCHEMA.names
+            )
+        )
+    raise FileNotFoundError(csv_path)
+
+
 def load_corp_codes_optimized(xml_path='CORPCODE.xml', csv_path='corp_codes.csv', force_refresh=False):
     """
-    CORPCODE.xml 파일을 파싱하여 CSV로 캐싱하고, 다음부터는 CSV를 읽어서 빠르게 로드합니다.
+    CORPCODE.xml 파일을 파싱하여 Parquet로 캐싱하고, 다음부터는 캐시를 읽어서 빠르게 로드합니다.
+    기존 CSV 캐시만 있는 경우 최초 1회 Parquet로 변환합니다.
     
     Args:
         xml_path (str): CORPCODE.xml 파일의 경로 (기본값: 'CORPCODE.xml').
-        csv_path (str): 캐시용 CSV 파일의 경로 (기본값: 'corp_codes.csv').
-        force_refresh (bool): True면 기존 CSV를 무시하고 XML을 다시 파싱 (기본값: False).
+        csv_path (str): 기존 CSV 캐시 경로 (기본값: 'corp_codes.csv', Parquet 경로는 확장자만 변경).
+        force_refresh (bool): True면 기존 캐시를 무시하고 XML을 다시 파싱 (기본값: False).
     
     Returns:
         pandas.DataFrame: 'corp_name'과 'corp_code' 컬럼을 가진 DataFrame.
     """
     
-    # 1. force_refresh가 False이고 CSV 파일이 존재하면 CSV에서 바로 로드
-    if not force_refresh and os.path.exists(csv_path):
+    # 1. force_refresh가 False이고 캐시 파일이 존재하면 캐시에서 바로 로드
+    if not force_refresh:
         try:
-            print(f"⚡ 기존 CSV 파일에서 빠르게 로드합니다: {csv_path}")
             start_time = datetime.now()
             
-            df = pd.read_csv(csv_path)
+            df = _read_corp_code_cache(csv_path)
             
-            end_time = datetime.now()
-            load_time = (end_time - start_time).total_seconds()
-            
-            print(f"✅ CSV 로드 완료: {len(df)}개 기업 정보 ({load_time:.2f}초)")
-            return df
+            if df is not None:
+                end_time = datetime.now()
+                load_time = (end_time - start_time).total_seconds()
+                
+                print(f"✅ 캐시 로드 완료: {len(df)}개 기업 정보 ({load_time:.2f}초)")
+                return df
             
         except Exception as e:
-            print(f"⚠️ CSV 파일 읽기 실패: {e}")
+            print(f"⚠️ 캐시 파일 읽기 실패: {e}")
             print("XML 파일에서 다시 파싱합니다...")
     
     # 2. XML 파일이 존재하지 않으면 오류 반환
@@ -191,39 +517,20 @@ def load_corp_codes_optimized(xml_path='CORPCODE.xml', csv_path='corp_codes.csv'
         print(f"🔄 XML 파싱 시작: {xml_path} (시간이 걸릴 수 있습니다...)")
         start_time = datetime.now()
         
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        corp_list = []
-        total_corps = len(root.findall('list'))
-        
-        for i, corp in enumerate(root.findall('list'), 1):
-            corp_name = corp.find('corp_name').text
-            corp_code = corp.find('corp_code').text
-            
-            corp_list.append({
-                'corp_name': corp_name,
-                'corp_code': corp_code
-            })
-            
-            # 진행 상황 표시 (10000개마다)
-            if i % 10000 == 0:
-                print(f"  파싱 진행: {i:,}/{total_corps:,} ({i/total_corps*100:.1f}%)")
-        
-        df = pd.DataFrame(corp_list)
+        corp_names, corp_codes = _parse_corp_code_xml(xml_path, show_progress=True)
+        df = pd.DataFrame({'corp_name': corp_names, 'corp_code': corp_codes})
         
         end_time = datetime.now()
         parse_time = (end_time - start_time).total_seconds()
         
         print(f"✅ XML 파싱 완료: {len(df)}개 기업 정보 ({parse_time:.2f}초)")
         
-        # 4. CSV로 저장 (다음번에 빠르게 로드하기 위해)
+        # 4. Parquet로 저장 (다음번에 빠르게 로드하기 위해)
         try:
-            print(f"💾 CSV 파일로 저장합니다: {csv_path}")
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')  # BOM 추가로 한글 호환성 향상
-            print(f"✅ CSV 저장 완료. 다음부터는 빠르게 로드됩니다!")
+            cache_path = _save_corp_code_cache(df, csv_path)
+            print(f"✅ Parquet 캐시 저장 완료: {cache_path}. 다음부터는 빠르게 로드됩니다!")
         except Exception as e:
-            print(f"⚠️ CSV 저장 실패: {e} (기능은 정상 작동합니다)")
+            print(f"⚠️ 캐시 저장 실패: {e} (기능은 정상 작동합니다)")
         
         return df
         
@@ -234,77 +541,90 @@ def load_corp_codes_optimized(xml_path='CORPCODE.xml', csv_path='corp_codes.csv'
 
 def get_corp_info_fast(company_name, csv_path='corp_codes.csv'):
     """
-    빠른 회사 정보 조회 함수. CSV 파일에서 바로 회사 정보를 찾습니다.
+    빠른 회사 정보 조회 함수. 기업 코드 캐시에서 바로 회사 정보를 찾습니다.
     
     Args:
         company_name (str): 찾고 싶은 회사명.
-        csv_path (str): CSV 파일 경로.
+        csv_path (str): CSV 캐시 경로 (Parquet 캐시가 있으면 Parquet를 사용).
         
     Returns:
         dict | None: {'corp_name': 회사명, 'corp_code': 고유번호} 또는 None.
     """
-    if not os.path.exists(csv_path):
-        print(f"❌ CSV 파일이 없습니다: {csv_path}")
-        print("먼저 load_corp_codes_optimized() 함수를 실행해주세요.")
-        return None
-    
     try:
-        # CSV에서 특정 회사만 검색 (메모리 효율적)
-        # corp_code를 문자열로 읽어서 앞의 0이 제거되지 않도록 함
-        df = pd.read_csv(csv_path, dtype={'corp_code': str})
-        result = df[df['corp_name'] == company_name]
+        # 최초 호출 시 한 번만 캐시를 읽고, 이후에는 딕셔너리 조회만 수행
+        corp_code = _load_code_map(csv_path).get(company_name)
         
-        if not result.empty:
-            corp_code = result.iloc[0]['corp_code']
-            # 8자리 형식으로 보장 (DART API 요구사항)
-            corp_code = str(corp_code).zfill(8)
+        if corp_code:
             return {
-                'corp_name': result.iloc[0]['corp_name'],
+                'corp_name': company_name,
                 'corp_code': corp_code
             }
         else:
             return None
             
+    except FileNotFoundError:
+        print(f"❌ 기업 코드 캐시 파일이 없습니다: {csv_path}")
+        print("먼저 load_corp_codes_optimized() 함수를 실행해주세요.")
+        return None
     except Exception as e:
         print(f"❌ 검색 중 오류: {e}")
         return None
 
 
-def search_companies_by_keyword(keyword, csv_path='corp_codes.csv', max_results=20):
+def search_companies_by_keyword(keyword, csv_path='corp_codes.csv', max_results=20, force_refresh=False):
     """
-    키워드로 회사를 검색합니다.
+    키워드로 회사를 검색합니다. (회사명에 키워드가 포함된 기업, 정규식이 아닌 문자열 포함 검색)
     
     Args:
         keyword (str): 검색할 키워드.
-        csv_path (str): CSV 파일 경로.
+        csv_path (str): CSV 캐시 경로 (Parquet 캐시가 있으면 Parquet를 사용).
         max_results (int): 최대 결과 개수.
+        force_refresh (bool): True면 메모리에 캐싱된 테이블을 버리고 파일을 다시 읽음 (기본값: False).
         
     Returns:
         pandas.DataFrame: 검색 결과 DataFrame.
     """
-    if not os.path.exists(csv_path):
-        print(f"❌ CSV 파일이 없습니다: {csv_path}")
-        return pd.DataFrame()
-    
     try:
-        df = pd.read_csv(csv_path)
-        results = df[df['corp_name'].str.contains(keyword, na=False)]
+        if force_refresh:
+            _load_corp_code_table.cache_clear()
+        
+        table = _load_corp_code_table(csv_path)
         
-        if len(results) > max_results:
-            print(f"🔍 '{keyword}' 검색결과: {len(results)}개 (상위 {max_results}개만 표시)")
-            return results.head(max_results)
+        # Arrow 문자열 커널로 전체 컬럼을 한 번에 필터링 (null은 제외)
+        mask = pc.fill_null(pc.match_substring(table['corp_name'], keyword), False)
+        results = table.filter(mask)
+        
+        if results.num_rows > max_results:
+            print(f"🔍 '{keyword}' 검색결과: {results.num_rows}개 (상위 {max_results}개만 표시)")
+            return results.slice(0, max_results).to_pandas()
         else:
-            print(f"🔍 '{keyword}' 검색결과: {len(results)}개")
-            return results
+            print(f"🔍 '{keyword}' 검색결과: {results.num_rows}개")
+            return results.to_pandas()
             
+    except FileNotFoundError:
+        print(f"❌ 기업 코드 캐시 파일이 없습니다: {csv_path}")
+        return pd.DataFrame()
     except Exception as e:
         print(f"❌ 검색 중 오류: {e}")
         return pd.DataFrame()
 
 
-def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1, page_count=10):
+# DART 공시 목록에서 유지할 필드
+_DISCLOSURE_FIELDS = (
+    'corp_name',
+    'report_nm',  # 보고서명
+    'rcept_no',   # 접수번호
+    'flr_nm',     # 공시제출인명
+    'rcept_dt',   # 접수일자
+    'rm'          # 비고
+)
+
+
+def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1, page_count=10, force_refresh=False,
+                           session=None):
     """
     DART API를 사용하여 특정 회사의 공시 정보를 가져옵니다.
+    같은 조회 조건의 정상 응답은 하루 동안 디스크에 캐싱됩니다.
     
     Args:
         corp_code (str): 8자리 회사 고유번호.
@@ -312,6 +632,8 @@ def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1,
         end_date (str): 검색 종료일 (YYYYMMDD 형식, 기본값: 오늘).
         page_no (int): 페이지 번호 (기본값: 1).
         page_count (int): 페이지당 건수 (기본값: 10, 최대 100).
+        force_refresh (bool): True면 캐시를 무시하고 API를 다시 호출 (기본값: False).
+        session (requests.Session): 사용할 HTTP 세션 (기본값: 모듈 공유 세션).
         
     Returns:
         List[Dict]: 공시 정보 리스트 또는 빈 리스트.
@@ -320,18 +642,21 @@ def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1,
     # DART API 키 (무료 API 키 발급 필요: https://opendart.fss.or.kr/)
     DART_API_KEY = ""  # ◀◀◀ 실제 API 키로 교체 필요!
     
-    # 고유번호를 8자리 형식으로 보장
-    corp_code = str(corp_code).zfill(8)
+    # 고유번호를 8자리 형식으로 보장 (get_corp_info_fast 결과는 이미 8자리이므로 방어용)
+    corp_code = f"{corp_code:0>8}"
     
     # 기본 날짜 설정 (30일 전부터 오늘까지)
     if not end_date:
-        end_date = datetime.now().strftime('%Y%m%d')
+        end_date = date_str_days_ago(0)
     if not start_date:
-        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y%m%d')
+        start_date = date_str_days_ago(30)
     
     # DART API 엔드포인트
     url = "https://opendart.fss.or.kr/api/list.json"
     
+    # 최대 100건의 공시 목록 JSON은 장황하므로 gzip 압축 응답을 명시적으로 요청 (requests가 자동 해제)
+    headers = {'Accept-Encoding': 'gzip'}
+    
     params = {
         'crtfc_key': DART_API_KEY,
         'corp_code': corp_code,
@@ -341,13 +666,27 @@ def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1,
         'page_count': min(page_count, 100)  # 최대 100건으로 제한
     }
     
+    # 캐시 키에는 API 키를 포함하지 않음
+    cache_key = _api_cache_key(url, {k: v for k, v in params.items() if k != 'crtfc_key'})
+    data = None if force_refresh else _api_cache_get(cache_key, _DART_CACHE_TTL)
+    
     try:
-        print(f"🔍 DART API 호출: {corp_code} ({start_date}~{end_date})")
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
+        if data is None:
+            print(f"🔍 DART API 호출: {corp_code} ({start_date}~{end_date})")
+            
+            with _DART_SEMAPHORE:
+                response = (session or _SESSION).get(url, headers=headers, params=params)
+            response.raise_for_status()
+            
+            # 압축 해제된 본문(bytes)을 한 번만 읽어 바로 파싱 (response.text 디코딩 생략)
+            raw = response.content
+            data = _loads_json(raw)
+            
+            # 정상 응답(000)과 '조회된 데이터 없음'(013)만 캐싱
+            if data.get('status') in ('000', '013'):
+                _api_cache_set(cache_key, data)
+        else:
+            print(f"⚡ 캐시된 DART 응답 사용: {corp_code} ({start_date}~{end_date})")
         
         # API 응답 상태 확인
         if data.get('status') != '000':
@@ -362,17 +701,10 @@ def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1,
             print(f"✅ DART 공시 정보 {len(disclosures)}건 수집 완료")
             
             # 필요한 정보만 추출하여 정리
-            cleaned_disclosures = []
-            for item in disclosures:
-                cleaned_item = {
-                    'corp_name': item.get('corp_name', ''),
-                    'report_nm': item.get('report_nm', ''),  # 보고서명
-                    'rcept_no': item.get('rcept_no', ''),    # 접수번호
-                    'flr_nm': item.get('flr_nm', ''),        # 공시제출인명
-                    'rcept_dt': item.get('rcept_dt', ''),    # 접수일자
-                    'rm': item.get('rm', '')                 # 비고
-                }
-                cleaned_disclosures.append(cleaned_item)
+            cleaned_disclosures = [
+                {key: item.get(key, '') for key in _DISCLOSURE_FIELDS}
+                for item in disclosures
+            ]
             
             return cleaned_disclosures
         else:
@@ -387,7 +719,8 @@ def fetch_dart_disclosures(corp_code, start_date=None, end_date=None, page_no=1,
         return []
 
 
-def get_company_disclosures_by_name(company_name, csv_path='corp_codes.csv', days_back=30, max_count=10):
+def get_company_disclosures_by_name(company_name, csv_path='corp_codes.csv', days_back=30, max_count=10,
+                                    start_date=None, end_date=None, session=None):
     """
     회사명으로 최근 공시 정보를 가져오는 통합 함수.
     
@@ -396,6 +729,9 @@ def get_company_disclosures_by_name(company_name, csv_path='corp_codes.csv', day
         csv_path (str): CSV 파일 경로.
         days_back (int): 조회할 과거 일수 (기본값: 30일).
         max_count (int): 최대 공시 건수 (기본값: 10건).
+        start_date (str): 검색 시작일 (YYYYMMDD, 지정하면 days_back 대신 사용).
+        end_date (str): 검색 종료일 (YYYYMMDD, 기본값: 오늘).
+        session (requests.Session): 사용할 HTTP 세션 (기본값: 모듈 공유 세션).
         
     Returns:
         List[Dict]: 공시 정보 리스트.
@@ -413,20 +749,44 @@ def get_company_disclosures_by_name(company_name, csv_path='corp_codes.csv', day
     corp_code = corp_info['corp_code']
     print(f"✅ 회사 정보: {corp_info['corp_name']} ({corp_code})")
     
-    # 2단계: DART API로 공시 정보 가져오기
-    start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%d')
-    end_date = datetime.now().strftime('%Y%m%d')
+    # 2단계: DART API로 공시 정보 가져오기 (여러 기업 조회 시 미리 계산한 날짜를 전달받아 재사용)
+    if not start_date:
+        start_date = date_str_days_ago(days_back)
+    if not end_date:
+        end_date = date_str_days_ago(0)
     
     disclosures = fetch_dart_disclosures(
         corp_code=corp_code,
         start_date=start_date,
         end_date=end_date,
-        page_count=max_count
+        page_count=max_count,
+        session=session
     )
     
     return disclosures
 
 
+def format_news_for_llm(news_articles, company_name):
+    """
+    회사명이 제목이나 요약에 포함된 뉴스의 헤드라인만 골라 LLM용으로 포맷팅합니다.
+    
+    Args:
+        news_articles (List[Dict]): fetch_naver_news 결과.
+        company_name (str): 회사명.
+        
+    Returns:
+        str: 포맷팅된 뉴스 텍스트 (관련 뉴스가 없으면 빈 문자열).
+    """
+    headlines = [
+        article['title'] for article in news_articles
+        if company_name in article['title'] or company_name in article['description']
+    ]
+    
+    if not headlines:
+        return ""
+    return f"### {company_name} 최신 뉴스\n- " + "\n- ".join(headlines) + "\n"
+
+
 def format_disclosures_for_llm(disclosures, company_name):
     """
     공시 정보를 LLM이 분석하기 좋은 형태로 포맷팅합니다.
@@ -442,31 +802,129 @@ def format_disclosures_for_llm(disclosures, company_name):
     if not disclosures:
         return f"### {company_name} 최근 공시 정보\n- 최근 30일간 공시된 정보가 없습니다."
     
-    formatted_text = f"### {company_name} 최근 공시 정보\n"
+    parts = [f"### {company_name} 최근 공시 정보\n"]
     
     for i, disclosure in enumerate(disclosures, 1):
         # 날짜 포맷팅 (YYYYMMDD -> YYYY-MM-DD)
-        rcept_dt = disclosure.get('rcept_dt', '')
-        if len(rcept_dt) == 8:
-            formatted_date = f"{rcept_dt[:4]}-{rcept_dt[4:6]}-{rcept_dt[6:8]}"
-        else:
-            formatted_date = rcept_dt
+        formatted_date = format_date(disclosure.get('rcept_dt', ''))
         
         report_nm = disclosure.get('report_nm', '제목 없음')
         flr_nm = disclosure.get('flr_nm', '제출인 미상')
         rm = disclosure.get('rm', '')
         
-        formatted_text += f"\n**{i}. {report_nm}**\n"
-        formatted_text += f"   - 제출일: {formatted_date}\n"
-        formatted_text += f"   - 제출인: {flr_nm}\n"
+        parts.append(f"\n**{i}. {report_nm}**\n   - 제출일: {formatted_date}\n   - 제출인: {flr_nm}\n")
         
         if rm:
-            formatted_text += f"   - 비고: {rm}\n"
+            parts.append(f"   - 비고: {rm}\n")
+    
+    return "".join(parts)
+
+
+# 중요도별 공시 분류 키워드 (위에 있는 우선순위/분류가 먼저 적용됨)
+DISCLOSURE_KEYWORDS = {
+    'priority_1': {
+        '정기보고서': ['사업보고서', '분기보고서', '반기보고서'],
+        '실적공시': ['영업실적', '잠정실적', '연결실적', '별도실적']
+    },
+    'priority_2': {
+        'M&A_투자': ['타법인주식', '타법인 주식', '출자증권', '지분취득', '지분처분'],
+        '증자': ['유상증자', '무상증자', '신주발행'],
+        '자사주': ['자기주식취득', '자기주식처분', '자사주매입']
+    },
+    'priority_3': {
+        '계약수주': ['단일판매', '공급계약', '계약체결', '수주'],
+        '투자확장': ['신규시설투자', '설비투자', '투자결정']
+    },
+    'risk_signals': {
+        '지배구조': ['최대주주변경', '주주변경'],
+        '법적리스크': ['소송제기', '소송신청', '분쟁']
+    }
+}
+
+
+def _build_disclosure_matcher(keywords):
+    """
+    공시 키워드 전체를 한 번에 검색하는 매처를 생성합니다.
+    pyahocorasick이 있으면 Aho-Corasick 오토마톤을, 없으면 하나의 정규식을 사용합니다.
+    
+    Args:
+        keywords (dict): {priority: {category: [keyword, ...]}} 형태의 키워드 정의.
+        
+    Returns:
+        Callable[[str], tuple | None]: 소문자 보고서명을 받아
+            (순위, priority, category) 중 순위가 가장 높은 항목 또는 None을 반환하는 함수.
+    """
+    # 키워드 -> (순위, priority, category). 같은 키워드는 먼저 정의된 분류를 사용
+    ranked = {}
+    for rank, (priority, category, keyword_list) in enumerate(
+        (p, c, kws) for p, categories in keywords.items() for c, kws in categories.items()
+    ):
+        for keyword in keyword_list:
+            ranked.setdefault(keyword.lower(), (rank, priority, category))
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword, value in ranked.items():
+            automaton.add_word(keyword, value)
+        automaton.make_automaton()
+        
+        def match(text):
+            hits = [value for _, value in automaton.iter(text)]
+            return min(hits) if hits else None
+    else:
+        # 전방탐색으로 겹치는 키워드까지 모두 찾음 (같은 위치에서는 순위가 높은 키워드 우선)
+        ordered = sorted(ranked, key=lambda k: ranked[k][0])
+        pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+        
+        def match(text):
+            hits = [ranked[m.group(1)] for m in pattern.finditer(text)]
+            return min(hits) if hits else None
+    
+    return match
+
+
+_match_disclosure_keywords = _build_disclosure_matcher(DISCLOSURE_KEYWORDS)
+
+
+def build_company_matcher(company_names):
+    """
+    여러 기업명을 텍스트 한 번 훑기로 모두 찾는 매처를 생성합니다.
+    뉴스 기사마다 기업명별로 부분 문자열 검색을 반복하지 않도록 한 번만 만들어 재사용합니다.
+    
+    Args:
+        company_names (Iterable[str]): 찾을 기업명 목록.
+        
+    Returns:
+        Callable[[str], set]: 텍스트를 받아 포함된 기업명 집합을 반환하는 함수.
+    """
+    names = sorted({name for name in company_names if name}, key=len, reverse=True)
+    if not names:
+        return lambda text: set()
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        
+        def match(text):
+            return {name for _, name in automaton.iter(text)}
+    else:
+        # 같은 위치에서는 가장 긴 기업명이 잡히므로, 그 접두사인 기업명도 함께 반환 (예: SK, SK하이닉스)
+        prefixes = {name: [other for other in names if name.startswith(other)] for name in names}
+        pattern = re.compile('(?=(' + '|'.join(map(re.escape, names)) + '))')
+        
+        def match(text):
+            found = set()
+            for m in pattern.finditer(text):
+                found.update(prefixes[m.group(1)])
+            return found
     
-    return formatted_text
+    return match
 
 
-def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv', days_back=90):
+def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv', days_back=90,
+                                          start_date=None, end_date=None, session=None):
     """
     중요도별로 분류된 공시 정보를 가져오는 함수.
     
@@ -474,6 +932,9 @@ def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv
         company_name (str): 회사명.
         csv_path (str): CSV 파일 경로.
         days_back (int): 조회할 과거 일수 (기본값: 90일).
+        start_date (str): 검색 시작일 (YYYYMMDD, 지정하면 days_back 대신 사용).
+        end_date (str): 검색 종료일 (YYYYMMDD, 기본값: 오늘).
+        session (requests.Session): 사용할 HTTP 세션 (기본값: 모듈 공유 세션).
         
     Returns:
         dict: 중요도별로 분류된 공시 정보.
@@ -483,7 +944,8 @@ def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv
     
     # 1. 전체 공시 가져오기 (더 많은 데이터를 위해 90일, 최대 100건)
     all_disclosures = get_company_disclosures_by_name(
-        company_name, csv_path, days_back=days_back, max_count=100
+        company_name, csv_path, days_back=days_back, max_count=100,
+        start_date=start_date, end_date=end_date, session=session
     )
     
     if not all_disclosures:
@@ -491,28 +953,7 @@ def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv
             'priority_1': [], 'priority_2': [], 'priority_3': [], 'risk_signals': []
         }
     
-    # 2. 중요도별 키워드 정의
-    keywords = {
-        'priority_1': {
-            '정기보고서': ['사업보고서', '분기보고서', '반기보고서'],
-            '실적공시': ['영업실적', '잠정실적', '연결실적', '별도실적']
-        },
-        'priority_2': {
-            'M&A_투자': ['타법인주식', '타법인 주식', '출자증권', '지분취득', '지분처분'],
-            '증자': ['유상증자', '무상증자', '신주발행'],
-            '자사주': ['자기주식취득', '자기주식처분', '자사주매입']
-        },
-        'priority_3': {
-            '계약수주': ['단일판매', '공급계약', '계약체결', '수주'],
-            '투자확장': ['신규시설투자', '설비투자', '투자결정']
-        },
-        'risk_signals': {
-            '지배구조': ['최대주주변경', '주주변경'],
-            '법적리스크': ['소송제기', '소송신청', '분쟁']
-        }
-    }
-    
-    # 3. 공시를 중요도별로 분류
+    # 2. 공시를 중요도별로 분류 (키워드는 DISCLOSURE_KEYWORDS 참고)
     classified_disclosures = {
         'priority_1': [],
         'priority_2': [],
@@ -521,22 +962,17 @@ def get_important_disclosures_by_priority(company_name, csv_path='corp_codes.csv
     }
     
     for disclosure in all_disclosures:
-        report_name = disclosure.get('report_nm', '').lower()
-        classified = False
+        # 보고서명을 한 번만 훑어서 가장 우선순위가 높은 분류를 찾음
+        match = _match_disclosure_keywords(disclosure.get('report_nm', '').lower())
         
-        # 각 우선순위별로 키워드 매칭
-        for priority, categories in keywords.items():
-            if classified:
-                break
-                
-            for category, keyword_list in categories.items():
-                if any(keyword.lower() in report_name for keyword in keyword_list):
-                    disclosure['category'] = category
-                    classified_disclosures[priority].append(disclosure)
-                    classified = True
-                    break
-    
-    # 4. 결과 요약
+        if match:
+            _, priority, category = match
+            disclosure['category'] = category
+            # 포맷팅 단계에서 다시 계산하지 않도록 날짜(YYYY-MM-DD)를 미리 저장
+            disclosure['formatted_date'] = format_date(disclosure.get('rcept_dt', ''))
+            classified_disclosures[priority].append(disclosure)
+    
+    # 3. 결과 요약
     print(f"\n📊 중요 공시 분류 결과:")
     print(f"  🏆 1순위 (실적/보고서): {len(classified_disclosures['priority_1'])}건")
     print(f"  🚀 2순위 (중대결정): {len(classified_disclosures['priority_2'])}건") 
@@ -553,6 +989,29 @@ def format_date(date_str):
     return date_str
 
 
+# 중요도별 공시 섹션 (priority 키, 섹션 제목, 분류 라벨) - 출력 순서대로
+_PRIORITY_SECTIONS = (
+    ('priority_1', '🏆 핵심 실적 정보', '분류'),        # 1순위: 실적과 직결된 정보
+    ('priority_2', '🚀 주요 경영 결정', '분류'),        # 2순위: 중대한 경영 결정
+    ('priority_3', '📈 사업 동향', '분류'),             # 3순위: 사업 흐름
+    ('risk_signals', '⚠️ 주의 사항', '리스크 요인'),    # 리스크 신호
+)
+
+
+def _append_priority_section(parts, disclosures, title, label):
+    """중요도별 공시 섹션 하나를 parts 리스트에 추가합니다. (공시가 없으면 생략)"""
+    if not disclosures:
+        return
+    
+    parts.append(f"\n#### {title}\n")
+    for disclosure in disclosures:
+        date = disclosure.get('formatted_date') or format_date(disclosure.get('rcept_dt', ''))
+        report = disclosure.get('report_nm', '')
+        category = disclosure.get('category', '')
+        
+        parts.append(f"- **{report}** ({date})\n  ✓ {label}: {category}\n")
+
+
 def format_priority_disclosures_for_llm(classified_disclosures, company_name):
     """
     중요도별로 분류된 공시 정보를 LLM용으로 포맷팅합니다.
@@ -565,58 +1024,18 @@ def format_priority_disclosures_for_llm(classified_disclosures, company_name):
         str: 포맷팅된 텍스트.
     """
     
-    formatted_text = f"### {company_name} 중요 공시 분석\n"
+    parts = [f"### {company_name} 중요 공시 분석\n"]
     
-    # 1순위: 실적과 직결된 정보
-    if classified_disclosures['priority_1']:
-        formatted_text += "\n#### 🏆 핵심 실적 정보\n"
-        for disclosure in classified_disclosures['priority_1']:
-            date = format_date(disclosure.get('rcept_dt', ''))
-            report = disclosure.get('report_nm', '')
-            category = disclosure.get('category', '')
-            
-            formatted_text += f"- **{report}** ({date})\n"
-            formatted_text += f"  ✓ 분류: {category}\n"
-    
-    # 2순위: 중대한 경영 결정
-    if classified_disclosures['priority_2']:
-        formatted_text += "\n#### 🚀 주요 경영 결정\n"
-        for disclosure in classified_disclosures['priority_2']:
-            date = format_date(disclosure.get('rcept_dt', ''))
-            report = disclosure.get('report_nm', '')
-            category = disclosure.get('category', '')
-            
-            formatted_text += f"- **{report}** ({date})\n"
-            formatted_text += f"  ✓ 분류: {category}\n"
-    
-    # 3순위: 사업 흐름
-    if classified_disclosures['priority_3']:
-        formatted_text += "\n#### 📈 사업 동향\n"
-        for disclosure in classified_disclosures['priority_3']:
-            date = format_date(disclosure.get('rcept_dt', ''))
-            report = disclosure.get('report_nm', '')
-            category = disclosure.get('category', '')
-            
-            formatted_text += f"- **{report}** ({date})\n"
-            formatted_text += f"  ✓ 분류: {category}\n"
-    
-    # 리스크 신호
-    if classified_disclosures['risk_signals']:
-        formatted_text += "\n#### ⚠️ 주의 사항\n"
-        for disclosure in classified_disclosures['risk_signals']:
-            date = format_date(disclosure.get('rcept_dt', ''))
-            report = disclosure.get('report_nm', '')
-            category = disclosure.get('category', '')
-            
-            formatted_text += f"- **{report}** ({date})\n"
-            formatted_text += f"  ✓ 리스크 요인: {category}\n"
+    # 실적 정보 > 경영 결정 > 사업 동향 > 리스크 신호 순으로 섹션 추가
+    for priority, title, label in _PRIORITY_SECTIONS:
+        _append_priority_section(parts, classified_disclosures[priority], title, label)
     
     # 분석이 없는 경우
     total_important = sum(len(v) for v in classified_disclosures.values())
     if total_important == 0:
-        formatted_text += "\n- 최근 90일간 주요 공시가 없습니다.\n"
+        parts.append("\n- 최근 90일간 주요 공시가 없습니다.\n")
     
-    return formatted_text
+    return "".join(parts)
 
 
 def create_smart_company_report(company_name, csv_path='corp_codes.csv'):
@@ -637,16 +1056,7 @@ def create_smart_company_report(company_name, csv_path='corp_codes.csv'):
     print("\n1. 최신 뉴스 수집...")
     news_articles = fetch_naver_news(company_name, display_count=5)
     
-    news_context = ""
-    if news_articles:
-        filtered_headlines = []
-        for article in news_articles:
-            if company_name in article['title'] or company_name in article['description']:
-                filtered_headlines.append(article['title'])
-        
-        if filtered_headlines:
-            news_context = f"### {company_name} 최신 뉴스\n"
-            news_context += "- " + "\n- ".join(filtered_headlines) + "\n"
+    news_context = format_news_for_llm(news_articles, company_name)
     
     # 2. 중요도별 공시 정보 수집
     print("\n2. 중요 공시 분석...")
@@ -757,16 +1167,7 @@ def create_comprehensive_company_report(company_name, csv_path='corp_codes.csv')
     print("\n1. 뉴스 정보 수집 중...")
     news_articles = fetch_naver_news(company_name, display_count=5)
     
-    news_context = ""
-    if news_articles:
-        filtered_headlines = []
-        for article in news_articles:
-            if company_name in article['title'] or company_name in article['description']:
-                filtered_headlines.append(article['title'])
-        
-        if filtered_headlines:
-            news_context = f"### {company_name} 최신 뉴스\n"
-            news_context += "- " + "\n- ".join(filtered_headlines) + "\n"
+    news_context = format_news_for_llm(news_articles, company_name)
     
     # 2. 공시 정보 수집
     print("\n2. 공시 정보 수집 중...")
@@ -787,64 +1188,171 @@ def create_comprehensive_company_report(company_name, csv_path='corp_codes.csv')
     return comprehensive_context
 
 
-def get_kospi_top_100_companies():
+def fetch_naver_news_for_companies(company_names, batch_size=5, display_count=50, force_refresh=False,
+                                   session=None, matcher=None, max_workers=4):
     """
-    코스피 상위 100개 기업 목록을 반환합니다.
-    (시가총액 기준 대략적인 순서, 2024년 기준)
+    여러 회사의 뉴스를 OR 검색어('A | B | ...')로 묶어 가져온 뒤, 기사에 언급된 회사별로 나눕니다.
+    회사마다 한 번씩 호출하는 대신 batch_size개 회사당 한 번만 호출하며, 응답은 fetch_naver_news와 같이 10분간 캐싱됩니다.
     
+    Args:
+        company_names (List[str]): 회사명 리스트.
+        batch_size (int): 검색어 하나로 묶을 회사 수 (기본값: 5).
+        display_count (int): 검색어당 가져올 뉴스 기사 수 (기본값: 50, 최대 100).
+        force_refresh (bool): True면 캐시를 무시하고 API를 다시 호출 (기본값: False).
+        session (requests.Session): 사용할 HTTP 세션 (기본값: 모듈 공유 세션).
+        matcher (Callable[[str], set]): build_company_matcher로 만든 매처 (기본값: company_names로 새로 생성).
+        max_workers (int): 동시에 보낼 검색 요청 수 (기본값: 4).
+        
     Returns:
-        List[str]: 코스피 상위 100개 기업명 리스트
+        dict: {회사명: 뉴스 기사 리스트} (제목이나 요약에 회사명이 포함된 기사만 포함, 없으면 빈 리스트).
     """
-    kospi_top_100 = [
-        # Top 10
-        "삼성전자", "SK하이닉스", "NAVER", "카카오", "LG에너지솔루션",
-        "삼성바이오로직스", "현대자동차", "기아", "삼성SDI", "LG화학",
-        
-        # 11-20
-        "POSCO홀딩스", "삼성물산", "KB금융", "신한지주", "하나금융지주",
-        "LG전자", "현대모비스", "셀트리온", "SK이노베이션", "삼성생명보험",
-        
-        # 21-30
-        "한국전력공사", "SK텔레콤", "포스코퓨처엠", "현대중공업", "삼성화재",
-        "LG생활건강", "KT&G", "한화솔루션", "고려아연", "삼성에스디에스",
-        
-        # 31-40
-        "아모레퍼시픽", "SK", "두산에너빌리티", "HMM", "한국조선해양",
-        "기업은행", "우리금융지주", "현대건설", "삼성전기", "LG이노텍",
-        
-        # 41-50
-        "KT", "한국가스공사", "롯데케미칼", "현대글로비스", "SK스퀘어",
-        "한미반도체", "삼성중공업", "포스코인터내셔널", "두산", "현대제철",
-        
-        # 51-60
-        "LG", "한화에어로스페이스", "KB국민은행", "신한은행", "하나은행",
-        "코웨이", "크래프톤", "펄어비스", "NCSoft", "넷마블",
-        
-        # 61-70
-        "카카오뱅크", "카카오페이", "컴투스", "위메이드", "넥슨게임즈",
-        "삼천리", "GS", "GS칼텍스", "S-Oil", "현대오일뱅크",
-        
-        # 71-80
-        "롯데쇼핑", "롯데칠성음료", "신세계", "이마트", "홈플러스",
-        "CJ제일제당", "CJ ENM", "CJ대한통운", "동원시스템즈", "오뚜기",
+    match = matcher or build_company_matcher(company_names)
+    groups = [company_names[i:i + batch_size] for i in range(0, len(company_names), batch_size)]
+    
+    def _search(group):
+        return fetch_naver_news(' | '.join(group), display_count=min(display_count, 100),
+                                force_refresh=force_refresh, session=session)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+        results = list(executor.map(_search, groups))
+    
+    # fetch_naver_news는 실패 시 빈 리스트를 반환하므로, 결과가 없는 묶음은 알려서 원인을 추적할 수 있게 함
+    for group, articles in zip(groups, results):
+        if not articles:
+            print(f"⚠️ 뉴스 묶음 검색 결과 없음 (호출 실패 가능): {', '.join(group)}")
+    
+    # 같은 기사가 여러 검색어에서 반환되어도 회사별로 한 번만 포함
+    news_by_company = {name: [] for name in company_names}
+    seen = set()
+    for articles in results:
+        for article in articles:
+            for name in match(article['title'] + "\n" + article['description']):
+                key = (name, article['title'], article['description'])
+                if name in news_by_company and key not in seen:
+                    seen.add(key)
+                    news_by_company[name].append(article)
+    
+    print(f"✅ {len(company_names)}개 기업 뉴스 {len(groups)}회 묶음 검색 완료")
+    return news_by_company
+
+
+def collect_companies_data_batch(company_names, csv_path='corp_codes.csv', news_count=5, max_workers=16):
+    """
+    여러 기업의 뉴스와 중요 공시 정보를 동시에 수집합니다.
+    기업별 요청은 서로 독립적이므로 스레드 풀로 병렬 실행하여,
+    전체 소요 시간을 '모든 요청 시간의 합'에서 '가장 느린 요청 시간' 수준으로 줄입니다.
+    
+    Args:
+        company_names (List[str]): 회사명 리스트.
+        csv_path (str): CSV 파일 경로.
+        news_count (int): 기업별 수집할 뉴스 수 (기본값: 5).
+        max_workers (int): 동시 실행 스레드 수 (기본값: 16).
         
-        # 81-90
-        "농심", "롯데제과", "한화시스템", "한화생명", "동화약품",
-        "유한양행", "녹십자", "셀트리온제약", "대웅제약", "종근당",
+    Returns:
+        dict: {회사명: {'news': 뉴스 리스트, 'disclosures': 중요도별 공시}}
+    """
+    
+    # 조회 기간은 모든 기업에 동일하므로 한 번만 계산
+    start_date = date_str_days_ago(90)
+    end_date = date_str_days_ago(0)
+    
+    def _collect(company_name):
+        return {
+            'news': fetch_naver_news(company_name, display_count=news_count),
+            'disclosures': get_important_disclosures_by_priority(
+                company_name, csv_path, start_date=start_date, end_date=end_date
+            )
+        }
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_collect, company_names))
+    
+    print(f"\n✅ {len(company_names)}개 기업 데이터 동시 수집 완료")
+    return dict(zip(company_names, results))
+
+
+def create_final_investment_reports_batch(company_names=None, csv_path='corp_codes.csv', max_workers=16):
+    """
+    여러 기업의 최종 투자 리포트를 병렬로 생성합니다.
+    기업별 작업은 대부분 네트워크 대기(네이버/DART)이고 소켓 대기 중에는 GIL이 해제되므로,
+    스레드 풀만으로도 동시 실행 수에 비례해 전체 소요 시간이 줄어듭니다.
+    (HTTP 세션과 기업 코드 캐시는 스레드 간에 공유해도 안전합니다.)
+    
+    Args:
+        company_names (List[str]): 회사명 리스트 (기본값: 코스피 상위 100개 기업).
+        csv_path (str): CSV 파일 경로.
+        max_workers (int): 동시 실행 스레드 수 (기본값: 16).
         
-        # 91-100
-        "삼성물산", "포스코DX", "SK머티리얼즈", "LG디스플레이", "삼성디스플레이",
-        "SK바이오팜", "한미약품", "일동제약", "부광약품", "대한항공"
-    ]
+    Returns:
+        List[dict]: create_final_investment_report 결과 리스트 (입력 순서 유지).
+    """
+    if company_names is None:
+        company_names = get_kospi_top_100_companies()
     
-    # 중복 제거 및 정확한 100개로 조정
-    unique_companies = list(dict.fromkeys(kospi_top_100))  # 순서 유지하면서 중복 제거
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda name: create_final_investment_report(name, csv_path), company_names)
+        if tqdm is not None:
+            results = tqdm(results, total=len(company_names), desc="투자 리포트 생성")
+        reports = list(results)
     
-    if len(unique_companies) > 100:
-        unique_companies = unique_companies[:100]
+    print(f"\n✅ {len(reports)}개 기업 최종 투자 리포트 생성 완료")
+    return reports
+
+
+# 코스피 상위 100개 기업 목록 (모듈 로드 시 한 번만 중복 제거, 순서 유지)
+_KOSPI_TOP_100 = tuple(dict.fromkeys([
+    # Top 10
+    "삼성전자", "SK하이닉스", "NAVER", "카카오", "LG에너지솔루션",
+    "삼성바이오로직스", "현대자동차", "기아", "삼성SDI", "LG화학",
+    
+    # 11-20
+    "POSCO홀딩스", "삼성물산", "KB금융", "신한지주", "하나금융지주",
+    "LG전자", "현대모비스", "셀트리온", "SK이노베이션", "삼성생명보험",
+    
+    # 21-30
+    "한국전력공사", "SK텔레콤", "포스코퓨처엠", "현대중공업", "삼성화재",
+    "LG생활건강", "KT&G", "한화솔루션", "고려아연", "삼성에스디에스",
+    
+    # 31-40
+    "아모레퍼시픽", "SK", "두산에너빌리티", "HMM", "한국조선해양",
+    "기업은행", "우리금융지주", "현대건설", "삼성전기", "LG이노텍",
+    
+    # 41-50
+    "KT", "한국가스공사", "롯데케미칼", "현대글로비스", "SK스퀘어",
+    "한미반도체", "삼성중공업", "포스코인터내셔널", "두산", "현대제철",
+    
+    # 51-60
+    "LG", "한화에어로스페이스", "KB국민은행", "신한은행", "하나은행",
+    "코웨이", "크래프톤", "펄어비스", "NCSoft", "넷마블",
+    
+    # 61-70
+    "카카오뱅크", "카카오페이", "컴투스", "위메이드", "넥슨게임즈",
+    "삼천리", "GS", "GS칼텍스", "S-Oil", "현대오일뱅크",
+    
+    # 71-80
+    "롯데쇼핑", "롯데칠성음료", "신세계", "이마트", "홈플러스",
+    "CJ제일제당", "CJ ENM", "CJ대한통운", "동원시스템즈", "오뚜기",
+    
+    # 81-90
+    "농심", "롯데제과", "한화시스템", "한화생명", "동화약품",
+    "유한양행", "녹십자", "셀트리온제약", "대웅제약", "종근당",
+    
+    # 91-100
+    "삼성물산", "포스코DX", "SK머티리얼즈", "LG디스플레이", "삼성디스플레이",
+    "SK바이오팜", "한미약품", "일동제약", "부광약품", "대한항공"
+]))[:100]
+
+
+def get_kospi_top_100_companies():
+    """
+    코스피 상위 100개 기업 목록을 반환합니다.
+    (시가총액 기준 대략적인 순서, 2024년 기준)
     
-    print(f"📈 코스피 상위 {len(unique_companies)}개 기업 목록 로드 완료")
-    return unique_companies
+    Returns:
+        List[str]: 코스피 상위 100개 기업명 리스트
+    """
+    print(f"📈 코스피 상위 {len(_KOSPI_TOP_100)}개 기업 목록 로드 완료")
+    return list(_KOSPI_TOP_100)
 
 
 def get_custom_company_list(list_type="top_10"):
@@ -863,16 +1371,14 @@ def get_custom_company_list(list_type="top_10"):
     Returns:
         List[str]: 선택된 기업 목록
     """
-    kospi_100 = get_kospi_top_100_companies()
-    
     if list_type == "top_10":
-        return kospi_100[:10]
+        return list(_KOSPI_TOP_100[:10])
     elif list_type == "top_30":
-        return kospi_100[:30]
+        return list(_KOSPI_TOP_100[:30])
     elif list_type == "top_50":
-        return kospi_100[:50]
+        return list(_KOSPI_TOP_100[:50])
     elif list_type == "top_100":
-        return kospi_100
+        return get_kospi_top_100_companies()
     elif list_type == "tech_focus":
         tech_companies = [
             "삼성전자", "SK하이닉스", "NAVER", "카카오", "LG에너지솔루션",
@@ -890,7 +1396,7 @@ def get_custom_company_list(list_type="top_10"):
         return finance_companies
     else:
         print(f"❌ 알 수 없는 list_type: {list_type}")
-        return kospi_100[:10]  # 기본값
+        return list(_KOSPI_TOP_100[:10])  # 기본값
 
 
 def save_company_list_to_file(companies, filename="target_companies.json"):
@@ -908,8 +1414,8 @@ def save_company_list_to_file(companies, filename="target_companies.json"):
     }
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(company_data, f, ensure_ascii=False, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps_json(company_data))
         print(f"✅ 기업 목록 저장 완료: {filename} ({len(companies)}개 기업)")
     except Exception as e:
         print(f"❌ 파일 저장 실패: {e}")
@@ -930,8 +1436,8 @@ def load_company_list_from_file(filename="target_companies.json"):
             print(f"❌ 파일이 없습니다: {filename}")
             return []
             
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = _loads_json(f.read())
             
         companies = data.get('companies', [])
         created_at = data.get('created_at', '')